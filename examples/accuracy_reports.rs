@@ -95,6 +95,7 @@ use lingua_welsh_language_model::WELSH_TESTDATA_DIRECTORY;
 use lingua_xhosa_language_model::XHOSA_TESTDATA_DIRECTORY;
 use lingua_yoruba_language_model::YORUBA_TESTDATA_DIRECTORY;
 use lingua_zulu_language_model::ZULU_TESTDATA_DIRECTORY;
+use once_cell::sync::Lazy;
 use std::collections::HashMap;
 use std::fs;
 use std::io::Write;
@@ -502,15 +503,13 @@ fn format_accuracy(accuracy: Decimal) -> String {
 }
 
 fn map_cld2_to_lingua(language: Option<CLD2Language>) -> Option<Language> {
+    static ISO_CODE_TO_LANGUAGE_MAPPING: Lazy<HashMap<String, Language>> = Lazy::new(|| {
+        Language::iter()
+            .map(|it| (it.iso_code_639_1().to_string(), it))
+            .collect()
+    });
     match language {
-        Some(cld2_language) => {
-            for lingua_language in Language::iter() {
-                if cld2_language.0 == lingua_language.iso_code_639_1().to_string() {
-                    return Some(lingua_language);
-                }
-            }
-            None
-        }
+        Some(cld2_language) => ISO_CODE_TO_LANGUAGE_MAPPING.get(cld2_language.0).copied(),
         None => None,
     }
 }
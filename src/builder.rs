@@ -26,6 +26,7 @@ pub struct LanguageDetectorBuilder {
     languages: HashSet<Language>,
     minimum_relative_distance: f64,
     is_every_language_model_preloaded: bool,
+    is_low_accuracy_mode_enabled: bool,
 }
 
 impl LanguageDetectorBuilder {
@@ -160,12 +161,29 @@ impl LanguageDetectorBuilder {
         self
     }
 
+    /// Configures `LanguageDetectorBuilder` to use low accuracy mode.
+    ///
+    /// By default, *Lingua* uses high accuracy mode which loads the ngram models of
+    /// five different lengths into memory. This offers the best possible detection
+    /// accuracy but at the cost of increased memory consumption and slower startup.
+    ///
+    /// In low accuracy mode, only a small subset of the language models is loaded
+    /// into memory, namely the trigram models. Memory consumption and startup time
+    /// are reduced significantly. The downside is that detection accuracy for very
+    /// short texts consisting of less than 120 characters will drop. Texts longer
+    /// than that remain mostly unaffected by this mode.
+    pub fn with_low_accuracy_mode(&mut self) -> &mut Self {
+        self.is_low_accuracy_mode_enabled = true;
+        self
+    }
+
     /// Creates and returns the configured instance of [LanguageDetector].
     pub fn build(&mut self) -> LanguageDetector {
         LanguageDetector::from(
             self.languages.clone(),
             self.minimum_relative_distance,
             self.is_every_language_model_preloaded,
+            self.is_low_accuracy_mode_enabled,
         )
     }
 
@@ -174,6 +192,7 @@ impl LanguageDetectorBuilder {
             languages,
             minimum_relative_distance: 0.0,
             is_every_language_model_preloaded: false,
+            is_low_accuracy_mode_enabled: false,
         }
     }
 }
@@ -181,15 +200,22 @@ impl LanguageDetectorBuilder {
 #[cfg(test)]
 mod tests {
     use super::*;
+    use rstest::*;
 
-    #[test]
-    fn assert_detector_can_be_built_from_all_languages() {
-        let mut builder = LanguageDetectorBuilder::from_all_languages();
-        assert_eq!(builder.languages, Language::all());
-        assert_eq!(builder.minimum_relative_distance, 0.0);
+    #[fixture]
+    fn builder_for_all_languages() -> LanguageDetectorBuilder {
+        LanguageDetectorBuilder::from_all_languages()
+    }
 
-        builder.with_minimum_relative_distance(0.2);
-        assert_eq!(builder.minimum_relative_distance, 0.2);
+    #[rstest]
+    fn assert_detector_can_be_built_from_all_languages(
+        mut builder_for_all_languages: LanguageDetectorBuilder,
+    ) {
+        assert_eq!(builder_for_all_languages.languages, Language::all());
+        assert_eq!(builder_for_all_languages.minimum_relative_distance, 0.0);
+
+        builder_for_all_languages.with_minimum_relative_distance(0.2);
+        assert_eq!(builder_for_all_languages.minimum_relative_distance, 0.2);
     }
 
     #[test]
@@ -268,49 +294,56 @@ mod tests {
         LanguageDetectorBuilder::from_languages(&[Language::German]);
     }
 
-    #[test]
-    fn assert_detector_can_be_built_from_iso_639_1_codes() {
-        let builder =
-            LanguageDetectorBuilder::from_iso_codes_639_1(&[IsoCode639_1::DE, IsoCode639_1::SV]);
-
-        assert_eq!(
-            builder.languages,
-            hashset!(Language::German, Language::Swedish)
-        );
-    }
+    #[rstest]
+    fn assert_detector_can_be_built_with_low_accuracy_mode(
+        mut builder_for_all_languages: LanguageDetectorBuilder,
+    ) {
+        assert!(!builder_for_all_languages.is_low_accuracy_mode_enabled);
 
-    #[test]
-    #[should_panic(expected = "LanguageDetector needs at least 2 languages to choose from")]
-    fn assert_detector_cannot_be_built_from_too_few_iso_639_1_codes() {
-        LanguageDetectorBuilder::from_iso_codes_639_1(&[IsoCode639_1::DE]);
+        builder_for_all_languages.with_low_accuracy_mode();
+        assert!(builder_for_all_languages.is_low_accuracy_mode_enabled);
     }
 
-    #[test]
-    fn assert_detector_can_be_built_from_iso_639_3_codes() {
-        let builder =
-            LanguageDetectorBuilder::from_iso_codes_639_3(&[IsoCode639_3::DEU, IsoCode639_3::SWE]);
-
+    #[rstest(
+        builder,
+        case::iso_639_1(LanguageDetectorBuilder::from_iso_codes_639_1(&[
+            IsoCode639_1::DE,
+            IsoCode639_1::SV
+        ])),
+        case::iso_639_3(LanguageDetectorBuilder::from_iso_codes_639_3(&[
+            IsoCode639_3::DEU,
+            IsoCode639_3::SWE
+        ]))
+    )]
+    fn assert_detector_can_be_built_from_iso_codes(builder: LanguageDetectorBuilder) {
         assert_eq!(
             builder.languages,
             hashset!(Language::German, Language::Swedish)
         );
     }
 
-    #[test]
+    #[rstest(
+        builder,
+        case::iso_639_1(LanguageDetectorBuilder::from_iso_codes_639_1(&[IsoCode639_1::DE])),
+        case::iso_639_3(LanguageDetectorBuilder::from_iso_codes_639_3(&[IsoCode639_3::DEU]))
+    )]
     #[should_panic(expected = "LanguageDetector needs at least 2 languages to choose from")]
-    fn assert_detector_cannot_be_built_from_too_few_iso_639_3_codes() {
-        LanguageDetectorBuilder::from_iso_codes_639_3(&[IsoCode639_3::DEU]);
+    fn assert_detector_cannot_be_built_from_too_few_iso_codes(builder: LanguageDetectorBuilder) {
+        drop(builder);
     }
 
-    #[test]
-    #[should_panic(expected = "minimum relative distance must lie in between 0.0 and 0.99")]
-    fn assert_detector_cannot_be_built_from_too_small_minimum_relative_distance() {
-        LanguageDetectorBuilder::from_all_languages().with_minimum_relative_distance(-2.3);
-    }
-
-    #[test]
+    #[rstest(
+        invalid_distance,
+        case(-0.01),
+        case(-2.3),
+        case(1.0),
+        case(1.7)
+    )]
     #[should_panic(expected = "minimum relative distance must lie in between 0.0 and 0.99")]
-    fn assert_detector_cannot_be_built_from_too_large_minimum_relative_distance() {
-        LanguageDetectorBuilder::from_all_languages().with_minimum_relative_distance(1.7);
+    fn assert_detector_cannot_be_built_from_invalid_minimum_relative_distance(
+        mut builder_for_all_languages: LanguageDetectorBuilder,
+        invalid_distance: f64,
+    ) {
+        builder_for_all_languages.with_minimum_relative_distance(invalid_distance);
     }
 }
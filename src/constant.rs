@@ -14,6 +14,7 @@
  * limitations under the License.
  */
 
+use crate::alphabet::Alphabet;
 use crate::language::Language;
 use crate::language::Language::*;
 use once_cell::sync::Lazy;
@@ -29,6 +30,12 @@ pub(crate) static NUMBERS: Lazy<Regex> = Lazy::new(|| Regex::new("\\p{N}").unwra
 pub(crate) static PUNCTUATION: Lazy<Regex> = Lazy::new(|| Regex::new("\\p{P}").unwrap());
 pub(crate) static LANGUAGES_SUPPORTING_LOGOGRAMS: Lazy<HashSet<Language>> =
     Lazy::new(|| hashset!(Chinese, Japanese, Korean));
+pub(crate) static LOGOGRAM_ALPHABETS: Lazy<HashSet<Alphabet>> = Lazy::new(|| {
+    LANGUAGES_SUPPORTING_LOGOGRAMS
+        .iter()
+        .flat_map(|it| it.alphabets())
+        .collect()
+});
 
 pub(crate) static CHARS_TO_LANGUAGES_MAPPING: Lazy<HashMap<&'static str, HashSet<Language>>> =
     Lazy::new(|| {
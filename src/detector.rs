@@ -16,8 +16,8 @@
 
 use crate::alphabet::Alphabet;
 use crate::constant::{
-    CHARS_TO_LANGUAGES_MAPPING, JAPANESE_CHARACTER_SET, LANGUAGES_SUPPORTING_LOGOGRAMS,
-    MULTIPLE_WHITESPACE, NO_LETTER, NUMBERS, PUNCTUATION,
+    CHARS_TO_LANGUAGES_MAPPING, JAPANESE_CHARACTER_SET, LOGOGRAM_ALPHABETS, MULTIPLE_WHITESPACE,
+    NO_LETTER, NUMBERS, PUNCTUATION,
 };
 use crate::language::Language;
 use crate::language::Language::*;
@@ -49,6 +49,7 @@ cfg_if! {
 pub struct LanguageDetector {
     languages: HashSet<Language>,
     minimum_relative_distance: f64,
+    is_low_accuracy_mode_enabled: bool,
     languages_with_unique_characters: HashSet<Language>,
     one_language_alphabets: HashMap<Alphabet, Language>,
     unigram_language_models: LazyLanguageToNgramsMapping,
@@ -63,6 +64,7 @@ impl LanguageDetector {
         languages: HashSet<Language>,
         minimum_relative_distance: f64,
         is_every_language_model_preloaded: bool,
+        is_low_accuracy_mode_enabled: bool,
     ) -> Self {
         let languages_with_unique_characters = languages
             .iter()
@@ -77,6 +79,7 @@ impl LanguageDetector {
         let dectector = Self {
             languages: languages.clone(),
             minimum_relative_distance,
+            is_low_accuracy_mode_enabled,
             languages_with_unique_characters,
             one_language_alphabets,
             unigram_language_models: unigram_models(),
@@ -95,11 +98,14 @@ impl LanguageDetector {
 
     fn preload_language_models(&self, languages: &HashSet<Language>) {
         languages.par_iter().for_each(|language| {
-            self.unigram_language_models.get(language).unwrap()();
-            self.bigram_language_models.get(language).unwrap()();
             self.trigram_language_models.get(language).unwrap()();
-            self.quadrigram_language_models.get(language).unwrap()();
-            self.fivegram_language_models.get(language).unwrap()();
+
+            if !self.is_low_accuracy_mode_enabled {
+                self.unigram_language_models.get(language).unwrap()();
+                self.bigram_language_models.get(language).unwrap()();
+                self.quadrigram_language_models.get(language).unwrap()();
+                self.fivegram_language_models.get(language).unwrap()();
+            }
         });
     }
 
@@ -136,6 +142,25 @@ impl LanguageDetector {
         Some(most_likely_language.clone())
     }
 
+    /// Detects the languages of all given input texts.
+    /// If a language cannot be reliably detected for a text, `None` is put into
+    /// the respective position of the returned vector.
+    ///
+    /// This method is a good fit if you want to detect the languages of a large
+    /// set of texts at once. The computation is parallelized across all available
+    /// CPU cores, so a single call to this method is cheaper than calling
+    /// [`detect_language_of`](#method.detect_language_of) once per text.
+    /// The returned vector contains one result for each input text, in the same order.
+    pub fn detect_languages_in_parallel_of<T: Into<String> + Clone + Sync>(
+        &self,
+        texts: &[T],
+    ) -> Vec<Option<Language>> {
+        texts
+            .par_iter()
+            .map(|text| self.detect_language_of(text.clone()))
+            .collect()
+    }
+
     /// Computes confidence values for each language considered possible for the given input text.
     ///
     /// A vector of all possible languages is returned, sorted by their confidence value in
@@ -179,7 +204,12 @@ impl LanguageDetector {
         }
 
         let character_count = cleaned_up_text.chars().count();
-        let ngram_length_range = if character_count >= 120 {
+
+        if self.is_low_accuracy_mode_enabled && character_count < 3 {
+            return values;
+        }
+
+        let ngram_length_range = if character_count >= 120 || self.is_low_accuracy_mode_enabled {
             3..4usize
         } else {
             1..6usize
@@ -216,6 +246,25 @@ impl LanguageDetector {
         self.compute_confidence_values(summed_up_probabilities, highest_probability)
     }
 
+    /// Computes confidence values for each language considered possible for the given
+    /// input texts.
+    ///
+    /// This method is a good fit if you want to classify a large set of texts at once.
+    /// The computation is parallelized across all available CPU cores, so a single call
+    /// to this method is cheaper than calling
+    /// [`compute_language_confidence_values`](#method.compute_language_confidence_values)
+    /// once per text. The returned vector contains one result for each input text,
+    /// in the same order.
+    pub fn compute_language_confidence_values_in_parallel<T: Into<String> + Clone + Sync>(
+        &self,
+        texts: &[T],
+    ) -> Vec<Vec<(Language, f64)>> {
+        texts
+            .par_iter()
+            .map(|text| self.compute_language_confidence_values(text.clone()))
+            .collect()
+    }
+
     fn clean_up_input_text(&self, text: String) -> String {
         let trimmed = text.trim().to_lowercase();
         let without_punctuation = PUNCTUATION.replace_all(&trimmed, "");
@@ -225,14 +274,13 @@ impl LanguageDetector {
     }
 
     fn split_text_into_words(&self, text: &str) -> Vec<String> {
-        let mut normalized_text_builder = vec![];
+        let mut normalized_text = String::with_capacity(text.len());
         for chr in text.chars() {
-            normalized_text_builder.push(chr.to_string());
+            normalized_text.push(chr);
             if self.is_logogram(chr) {
-                normalized_text_builder.push(' '.to_string());
+                normalized_text.push(' ');
             }
         }
-        let normalized_text: String = normalized_text_builder.join("");
         if normalized_text.contains(' ') {
             normalized_text
                 .split(' ')
@@ -248,10 +296,9 @@ impl LanguageDetector {
         if chr.is_whitespace() {
             false
         } else {
-            LANGUAGES_SUPPORTING_LOGOGRAMS
-                .iter()
-                .flat_map(|it| it.alphabets())
-                .any(|it| it.matches(&chr.to_string()))
+            let mut buffer = [0; 4];
+            let char_str = chr.encode_utf8(&mut buffer);
+            LOGOGRAM_ALPHABETS.iter().any(|it| it.matches(char_str))
         }
     }
 
@@ -595,6 +642,9 @@ mod tests {
     use once_cell::sync::OnceCell;
     use rstest::*;
 
+    const GERMAN_NOUN_ALTER: &str = "Alter";
+    const TEXT_WITHOUT_NGRAM_PROBABILITIES: &str = "проарплап";
+
     // ##############################
     // MOCKS
     // ##############################
@@ -888,10 +938,13 @@ mod tests {
         trigram_language_models: LazyLanguageToNgramsMapping,
         quadrigram_language_models: LazyLanguageToNgramsMapping,
         fivegram_language_models: LazyLanguageToNgramsMapping,
-    ) -> LanguageDetector {
-        LanguageDetector {
+    ) -> &'static LanguageDetector {
+        static DETECTOR_FOR_ENGLISH_AND_GERMAN_FIXTURE: OnceCell<LanguageDetector> =
+            OnceCell::new();
+        DETECTOR_FOR_ENGLISH_AND_GERMAN_FIXTURE.get_or_init(|| LanguageDetector {
             languages: hashset!(English, German),
             minimum_relative_distance: 0.0,
+            is_low_accuracy_mode_enabled: false,
             languages_with_unique_characters: hashset!(),
             one_language_alphabets: hashmap!(),
             unigram_language_models,
@@ -899,36 +952,64 @@ mod tests {
             trigram_language_models,
             quadrigram_language_models,
             fivegram_language_models,
-        }
+        })
+    }
+
+    #[fixture]
+    fn detector_for_english_and_german_with_low_accuracy_mode(
+        unigram_language_models: LazyLanguageToNgramsMapping,
+        bigram_language_models: LazyLanguageToNgramsMapping,
+        trigram_language_models: LazyLanguageToNgramsMapping,
+        quadrigram_language_models: LazyLanguageToNgramsMapping,
+        fivegram_language_models: LazyLanguageToNgramsMapping,
+    ) -> &'static LanguageDetector {
+        static DETECTOR_WITH_LOW_ACCURACY_MODE_FIXTURE: OnceCell<LanguageDetector> =
+            OnceCell::new();
+        DETECTOR_WITH_LOW_ACCURACY_MODE_FIXTURE.get_or_init(|| LanguageDetector {
+            languages: hashset!(English, German),
+            minimum_relative_distance: 0.0,
+            is_low_accuracy_mode_enabled: true,
+            languages_with_unique_characters: hashset!(),
+            one_language_alphabets: hashmap!(),
+            unigram_language_models,
+            bigram_language_models,
+            trigram_language_models,
+            quadrigram_language_models,
+            fivegram_language_models,
+        })
     }
 
     #[fixture]
     fn detector_for_all_languages(
         empty_language_models: LazyLanguageToNgramsMapping,
-    ) -> LanguageDetector {
-        let languages = Language::all();
-        let languages_with_unique_characters = languages
-            .iter()
-            .filter(|it| it.unique_characters().is_some())
-            .cloned()
-            .collect();
-
-        let one_language_alphabets = Alphabet::all_supporting_single_language()
-            .into_iter()
-            .filter(|(_, language)| languages.contains(language))
-            .collect();
+    ) -> &'static LanguageDetector {
+        static DETECTOR_FOR_ALL_LANGUAGES_FIXTURE: OnceCell<LanguageDetector> = OnceCell::new();
+        DETECTOR_FOR_ALL_LANGUAGES_FIXTURE.get_or_init(|| {
+            let languages = Language::all();
+            let languages_with_unique_characters = languages
+                .iter()
+                .filter(|it| it.unique_characters().is_some())
+                .cloned()
+                .collect();
 
-        LanguageDetector {
-            languages,
-            minimum_relative_distance: 0.0,
-            languages_with_unique_characters,
-            one_language_alphabets,
-            unigram_language_models: empty_language_models,
-            bigram_language_models: empty_language_models,
-            trigram_language_models: empty_language_models,
-            quadrigram_language_models: empty_language_models,
-            fivegram_language_models: empty_language_models,
-        }
+            let one_language_alphabets = Alphabet::all_supporting_single_language()
+                .into_iter()
+                .filter(|(_, language)| languages.contains(language))
+                .collect();
+
+            LanguageDetector {
+                languages,
+                minimum_relative_distance: 0.0,
+                is_low_accuracy_mode_enabled: false,
+                languages_with_unique_characters,
+                one_language_alphabets,
+                unigram_language_models: empty_language_models,
+                bigram_language_models: empty_language_models,
+                trigram_language_models: empty_language_models,
+                quadrigram_language_models: empty_language_models,
+                fivegram_language_models: empty_language_models,
+            }
+        })
     }
 
     // ##############################
@@ -936,7 +1017,7 @@ mod tests {
     // ##############################
 
     #[rstest]
-    fn assert_text_is_cleaned_up_properly(detector_for_all_languages: LanguageDetector) {
+    fn assert_text_is_cleaned_up_properly(detector_for_all_languages: &LanguageDetector) {
         let text = "Weltweit    gibt es ungefähr 6.000 Sprachen,
         wobei laut Schätzungen zufolge ungefähr 90  Prozent davon
         am Ende dieses Jahrhunderts verdrängt sein werden.";
@@ -952,7 +1033,7 @@ mod tests {
     }
 
     #[rstest]
-    fn assert_text_is_split_into_words_correctly(detector_for_all_languages: LanguageDetector) {
+    fn assert_text_is_split_into_words_correctly(detector_for_all_languages: &LanguageDetector) {
         assert_eq!(
             detector_for_all_languages.split_text_into_words("this is a sentence"),
             vec!["this", "is", "a", "sentence"]
@@ -987,7 +1068,7 @@ mod tests {
         case(German, "alter", 0.3)
     )]
     fn assert_ngram_probability_lookup_works_correctly(
-        detector_for_english_and_german: LanguageDetector,
+        detector_for_english_and_german: &LanguageDetector,
         language: Language,
         ngram: &str,
         expected_probability: f64,
@@ -1004,7 +1085,7 @@ mod tests {
     #[rstest]
     #[should_panic(expected = "zerogram detected")]
     fn assert_ngram_probability_lookup_does_not_work_for_zerogram(
-        detector_for_english_and_german: LanguageDetector,
+        detector_for_english_and_german: &LanguageDetector,
     ) {
         detector_for_english_and_german.look_up_ngram_probability(&English, &Ngram::new(""));
     }
@@ -1027,7 +1108,7 @@ mod tests {
         )
     )]
     fn assert_summation_of_ngram_probabilities_works_correctly(
-        detector_for_english_and_german: LanguageDetector,
+        detector_for_english_and_german: &LanguageDetector,
         ngrams: HashSet<&str>,
         expected_sum_of_probabilities: f64,
     ) {
@@ -1080,7 +1161,7 @@ mod tests {
         )
     )]
     fn assert_computation_of_language_probabilities_works_correctly(
-        detector_for_english_and_german: LanguageDetector,
+        detector_for_english_and_german: &LanguageDetector,
         test_data_model: TestDataLanguageModel,
         expected_probabilities: HashMap<Language, f64>,
     ) {
@@ -1102,7 +1183,7 @@ mod tests {
 
     #[rstest]
     fn assert_computation_of_confidence_values_works_correctly(
-        detector_for_english_and_german: LanguageDetector,
+        detector_for_english_and_german: &LanguageDetector,
     ) {
         let unigram_count_for_both_languages = 5.0;
 
@@ -1137,7 +1218,7 @@ mod tests {
             total_probability_for_german / total_probability_for_english;
 
         let confidence_values =
-            detector_for_english_and_german.compute_language_confidence_values("Alter");
+            detector_for_english_and_german.compute_language_confidence_values(GERMAN_NOUN_ALTER);
 
         assert_eq!(
             confidence_values[0],
@@ -1154,30 +1235,79 @@ mod tests {
 
     #[rstest]
     fn assert_language_of_german_noun_alter_is_detected_correctly(
-        detector_for_english_and_german: LanguageDetector,
+        detector_for_english_and_german: &LanguageDetector,
     ) {
-        let detected_language = detector_for_english_and_german.detect_language_of("Alter");
+        let detected_language =
+            detector_for_english_and_german.detect_language_of(GERMAN_NOUN_ALTER);
         assert_eq!(detected_language, Some(German));
     }
 
     #[rstest]
     fn assert_no_language_is_returned_when_no_ngram_probabilities_are_available(
-        detector_for_english_and_german: LanguageDetector,
+        detector_for_english_and_german: &LanguageDetector,
     ) {
-        let detected_language = detector_for_english_and_german.detect_language_of("проарплап");
+        let detected_language =
+            detector_for_english_and_german.detect_language_of(TEXT_WITHOUT_NGRAM_PROBABILITIES);
         assert_eq!(detected_language, None);
     }
 
+    #[rstest]
+    fn assert_language_of_german_noun_alter_is_detected_correctly_in_low_accuracy_mode(
+        detector_for_english_and_german_with_low_accuracy_mode: &LanguageDetector,
+    ) {
+        let detected_language = detector_for_english_and_german_with_low_accuracy_mode
+            .detect_language_of(GERMAN_NOUN_ALTER);
+        assert_eq!(detected_language, Some(German));
+    }
+
+    #[rstest]
+    fn assert_no_confidence_values_are_returned_for_short_text_in_low_accuracy_mode(
+        detector_for_english_and_german_with_low_accuracy_mode: &LanguageDetector,
+    ) {
+        let confidence_values = detector_for_english_and_german_with_low_accuracy_mode
+            .compute_language_confidence_values("xy");
+        assert_eq!(confidence_values, vec![]);
+    }
+
+    #[rstest]
+    fn assert_languages_are_detected_correctly_in_parallel(
+        detector_for_english_and_german: &LanguageDetector,
+    ) {
+        let detected_languages =
+            detector_for_english_and_german.detect_languages_in_parallel_of(&[
+                GERMAN_NOUN_ALTER,
+                TEXT_WITHOUT_NGRAM_PROBABILITIES,
+            ]);
+
+        assert_eq!(detected_languages, vec![Some(German), None]);
+    }
+
     #[rstest]
     fn assert_no_confidence_values_are_returned_when_no_ngram_probabilities_are_available(
-        detector_for_english_and_german: LanguageDetector,
+        detector_for_english_and_german: &LanguageDetector,
     ) {
-        let confidence_values =
-            detector_for_english_and_german.compute_language_confidence_values("проарплап");
+        let confidence_values = detector_for_english_and_german
+            .compute_language_confidence_values(TEXT_WITHOUT_NGRAM_PROBABILITIES);
 
         assert_eq!(confidence_values, vec![]);
     }
 
+    #[rstest]
+    fn assert_computation_of_confidence_values_in_parallel_works_correctly(
+        detector_for_english_and_german: &LanguageDetector,
+    ) {
+        let confidence_values = detector_for_english_and_german
+            .compute_language_confidence_values_in_parallel(&[
+                GERMAN_NOUN_ALTER,
+                TEXT_WITHOUT_NGRAM_PROBABILITIES,
+            ]);
+
+        assert_eq!(confidence_values.len(), 2);
+        assert_eq!(confidence_values[0][0], (German, 1.0));
+        assert_eq!(confidence_values[0][1].0, English);
+        assert_eq!(confidence_values[1], vec![]);
+    }
+
     #[rstest(
         word,
         expected_language,
@@ -1297,7 +1427,7 @@ mod tests {
         case("ในทางหลวงหมายเลข", Some(Thai)),
     )]
     fn assert_language_detection_with_rules_works_correctly(
-        detector_for_all_languages: LanguageDetector,
+        detector_for_all_languages: &LanguageDetector,
         word: &str,
         expected_language: Option<Language>,
     ) {
@@ -1426,7 +1556,7 @@ mod tests {
         ),
     )]
     fn assert_language_filtering_with_rules_works_correctly(
-        detector_for_all_languages: LanguageDetector,
+        detector_for_all_languages: &LanguageDetector,
         word: &str,
         expected_languages: HashSet<Language>,
     ) {
@@ -1441,7 +1571,7 @@ mod tests {
 
     #[rstest(invalid_str, case(""), case(" \n  \t;"), case("3<856%)§"))]
     fn assert_strings_without_letters_return_no_language(
-        detector_for_all_languages: LanguageDetector,
+        detector_for_all_languages: &LanguageDetector,
         invalid_str: &str,
     ) {
         assert_eq!(
@@ -20,7 +20,7 @@ use strum_macros::EnumString;
 /// This enum specifies the ISO 639-1 code representations for the supported languages.
 ///
 /// ISO 639 is a standardized nomenclature used to classify languages.
-#[derive(Debug, Eq, PartialEq, EnumString)]
+#[derive(Clone, Copy, Debug, Eq, PartialEq, Hash, EnumString)]
 #[allow(clippy::upper_case_acronyms)]
 #[strum(ascii_case_insensitive)]
 pub enum IsoCode639_1 {
@@ -253,7 +253,7 @@ pub enum IsoCode639_1 {
 /// This enum specifies the ISO 639-3 code representations for the supported languages.
 ///
 /// ISO 639 is a standardized nomenclature used to classify languages.
-#[derive(Debug, Eq, PartialEq, EnumString)]
+#[derive(Clone, Copy, Debug, Eq, PartialEq, Hash, EnumString)]
 #[allow(clippy::upper_case_acronyms)]
 #[strum(ascii_case_insensitive)]
 pub enum IsoCode639_3 {
@@ -16,14 +16,26 @@
 
 use crate::alphabet::Alphabet;
 use crate::isocode::{IsoCode639_1, IsoCode639_3};
+use once_cell::sync::Lazy;
 use serde::{Deserialize, Serialize};
-use std::collections::HashSet;
+use std::collections::{HashMap, HashSet};
 use strum::IntoEnumIterator;
 use strum_macros::{EnumIter, EnumString};
 
 /// This enum specifies the so far 75 supported languages which can be detected by *Lingua*.
 #[derive(
-    Clone, Debug, Serialize, Deserialize, EnumIter, Eq, PartialEq, Hash, Ord, PartialOrd, EnumString,
+    Clone,
+    Copy,
+    Debug,
+    Serialize,
+    Deserialize,
+    EnumIter,
+    Eq,
+    PartialEq,
+    Hash,
+    Ord,
+    PartialOrd,
+    EnumString,
 )]
 #[serde(rename_all(serialize = "UPPERCASE", deserialize = "UPPERCASE"))]
 #[strum(ascii_case_insensitive)]
@@ -107,49 +119,73 @@ pub enum Language {
 
 impl Language {
     pub fn all() -> HashSet<Language> {
-        Language::iter().collect()
+        static ALL_LANGUAGES: Lazy<HashSet<Language>> = Lazy::new(|| Language::iter().collect());
+        ALL_LANGUAGES.clone()
     }
 
     pub fn all_spoken_ones() -> HashSet<Language> {
-        Language::iter()
-            .filter(|it| it != &Language::Latin)
-            .collect()
+        static ALL_SPOKEN_LANGUAGES: Lazy<HashSet<Language>> = Lazy::new(|| {
+            Language::iter()
+                .filter(|it| it != &Language::Latin)
+                .collect()
+        });
+        ALL_SPOKEN_LANGUAGES.clone()
     }
 
     pub fn all_with_arabic_script() -> HashSet<Language> {
-        Language::iter()
-            .filter(|it| it.alphabets().contains(&Alphabet::Arabic))
-            .collect()
+        static ALL_LANGUAGES_WITH_ARABIC_SCRIPT: Lazy<HashSet<Language>> = Lazy::new(|| {
+            Language::iter()
+                .filter(|it| it.alphabets().contains(&Alphabet::Arabic))
+                .collect()
+        });
+        ALL_LANGUAGES_WITH_ARABIC_SCRIPT.clone()
     }
 
     pub fn all_with_cyrillic_script() -> HashSet<Language> {
-        Language::iter()
-            .filter(|it| it.alphabets().contains(&Alphabet::Cyrillic))
-            .collect()
+        static ALL_LANGUAGES_WITH_CYRILLIC_SCRIPT: Lazy<HashSet<Language>> = Lazy::new(|| {
+            Language::iter()
+                .filter(|it| it.alphabets().contains(&Alphabet::Cyrillic))
+                .collect()
+        });
+        ALL_LANGUAGES_WITH_CYRILLIC_SCRIPT.clone()
     }
 
     pub fn all_with_devanagari_script() -> HashSet<Language> {
-        Language::iter()
-            .filter(|it| it.alphabets().contains(&Alphabet::Devanagari))
-            .collect()
+        static ALL_LANGUAGES_WITH_DEVANAGARI_SCRIPT: Lazy<HashSet<Language>> = Lazy::new(|| {
+            Language::iter()
+                .filter(|it| it.alphabets().contains(&Alphabet::Devanagari))
+                .collect()
+        });
+        ALL_LANGUAGES_WITH_DEVANAGARI_SCRIPT.clone()
     }
 
     pub fn all_with_latin_script() -> HashSet<Language> {
-        Language::iter()
-            .filter(|it| it.alphabets().contains(&Alphabet::Latin))
-            .collect()
+        static ALL_LANGUAGES_WITH_LATIN_SCRIPT: Lazy<HashSet<Language>> = Lazy::new(|| {
+            Language::iter()
+                .filter(|it| it.alphabets().contains(&Alphabet::Latin))
+                .collect()
+        });
+        ALL_LANGUAGES_WITH_LATIN_SCRIPT.clone()
     }
 
     pub fn from_iso_code_639_1(iso_code: &IsoCode639_1) -> Language {
-        Language::iter()
-            .find(|it| &it.iso_code_639_1() == iso_code)
-            .unwrap()
+        static LANGUAGE_BY_ISO_CODE_639_1: Lazy<HashMap<IsoCode639_1, Language>> =
+            Lazy::new(|| {
+                Language::iter()
+                    .map(|it| (it.iso_code_639_1(), it))
+                    .collect()
+            });
+        LANGUAGE_BY_ISO_CODE_639_1.get(iso_code).copied().unwrap()
     }
 
     pub fn from_iso_code_639_3(iso_code: &IsoCode639_3) -> Language {
-        Language::iter()
-            .find(|it| &it.iso_code_639_3() == iso_code)
-            .unwrap()
+        static LANGUAGE_BY_ISO_CODE_639_3: Lazy<HashMap<IsoCode639_3, Language>> =
+            Lazy::new(|| {
+                Language::iter()
+                    .map(|it| (it.iso_code_639_3(), it))
+                    .collect()
+            });
+        LANGUAGE_BY_ISO_CODE_639_3.get(iso_code).copied().unwrap()
     }
 
     pub fn iso_code_639_1(&self) -> IsoCode639_1 {
@@ -268,11 +268,13 @@ pub use isocode::{IsoCode639_1, IsoCode639_3};
 pub use language::Language;
 pub use writer::{LanguageModelFilesWriter, TestDataFilesWriter};
 
+#[cfg(test)]
+use once_cell::sync::Lazy;
 #[cfg(test)]
 use regex::Regex;
 
 #[cfg(test)]
 pub(crate) fn minify(json: &str) -> String {
-    let re = Regex::new("\n\\s*").unwrap();
-    re.replace_all(json, "").to_string()
+    static MINIFY_REGEX: Lazy<Regex> = Lazy::new(|| Regex::new("\n\\s*").unwrap());
+    MINIFY_REGEX.replace_all(json, "").to_string()
 }
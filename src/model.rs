@@ -19,9 +19,14 @@ use crate::fraction::Fraction;
 use crate::language::Language;
 use crate::ngram::Ngram;
 use itertools::Itertools;
+use once_cell::sync::Lazy;
 use regex::Regex;
 use serde::{Deserialize, Serialize};
 use std::collections::{BTreeMap, HashMap, HashSet};
+use std::io;
+use std::io::Write;
+use std::iter::once;
+use std::sync::Mutex;
 
 #[cfg(test)]
 use mockall::automock;
@@ -84,7 +89,17 @@ impl TrainingDataLanguageModel {
         }
     }
 
+    #[allow(dead_code)]
     pub(crate) fn to_json(&self) -> String {
+        serde_json::to_string(&self.to_json_language_model()).unwrap()
+    }
+
+    pub(crate) fn write_json(&self, writer: &mut dyn Write) -> io::Result<()> {
+        serde_json::to_writer(writer, &self.to_json_language_model())?;
+        Ok(())
+    }
+
+    fn to_json_language_model(&self) -> JsonLanguageModel {
         let mut fractions_to_ngrams = hashmap!();
         for (ngram, fraction) in self.relative_frequencies.as_ref().unwrap() {
             let ngrams = fractions_to_ngrams.entry(fraction).or_insert_with(Vec::new);
@@ -99,12 +114,10 @@ impl TrainingDataLanguageModel {
             );
         }
 
-        let model = JsonLanguageModel {
+        JsonLanguageModel {
             language: self.language.clone(),
             ngrams: fractions_to_joined_ngrams,
-        };
-
-        serde_json::to_string(&model).unwrap()
+        }
     }
 
     #[allow(dead_code)]
@@ -121,22 +134,25 @@ impl TrainingDataLanguageModel {
         char_class: &str,
     ) -> HashMap<Ngram, u32> {
         let mut absolute_frequencies = hashmap!();
-        let regex = Regex::new(&format!("^[{}]+$", char_class)).unwrap_or_else(|_| {
-            panic!(
-                "The character class '{}' cannot be compiled to a valid regular expression",
-                char_class
-            )
-        });
+        let regex = Self::char_class_regex(char_class);
 
         for line in text.iter() {
-            let chars = line.to_lowercase().chars().collect_vec();
+            let char_boundaries = line
+                .char_indices()
+                .map(|(index, _)| index)
+                .chain(once(line.len()))
+                .collect_vec();
 
-            for i in 0..=chars.len() - ngram_length {
-                let slice = &chars[i..i + ngram_length].iter().collect::<String>();
+            for boundaries in char_boundaries.windows(ngram_length + 1) {
+                let slice = &line[boundaries[0]..boundaries[ngram_length]];
 
                 if regex.is_match(slice) {
-                    let counter = absolute_frequencies.entry(Ngram::new(slice)).or_insert(0);
-                    *counter += 1;
+                    match absolute_frequencies.get_mut(slice) {
+                        Some(counter) => *counter += 1,
+                        None => {
+                            absolute_frequencies.insert(Ngram::new(slice), 1);
+                        }
+                    }
                 }
             }
         }
@@ -144,6 +160,26 @@ impl TrainingDataLanguageModel {
         absolute_frequencies
     }
 
+    fn char_class_regex(char_class: &str) -> Regex {
+        static REGEX_CACHE: Lazy<Mutex<HashMap<String, Regex>>> =
+            Lazy::new(|| Mutex::new(hashmap!()));
+
+        let mut cache = REGEX_CACHE.lock().unwrap();
+        match cache.get(char_class) {
+            Some(regex) => regex.clone(),
+            None => {
+                let regex = Regex::new(&format!("^[{}]+$", char_class)).unwrap_or_else(|_| {
+                    panic!(
+                        "The character class '{}' cannot be compiled to a valid regular expression",
+                        char_class
+                    )
+                });
+                cache.insert(char_class.to_string(), regex.clone());
+                regex
+            }
+        }
+    }
+
     fn compute_relative_frequencies(
         ngram_length: usize,
         absolute_frequencies: &HashMap<Ngram, u32>,
@@ -181,14 +217,16 @@ impl TestDataLanguageModel {
         }
 
         let mut ngrams = hashset!();
-        let chars = text.chars().collect_vec();
-
-        if chars.len() >= ngram_length {
-            for i in 0..=chars.len() - ngram_length {
-                let slice = &chars[i..i + ngram_length].iter().collect::<String>();
-                if LETTER.is_match(slice) {
-                    ngrams.insert(Ngram::new(slice));
-                }
+        let char_boundaries = text
+            .char_indices()
+            .map(|(index, _)| index)
+            .chain(once(text.len()))
+            .collect_vec();
+
+        for boundaries in char_boundaries.windows(ngram_length + 1) {
+            let slice = &text[boundaries[0]..boundaries[ngram_length]];
+            if LETTER.is_match(slice) {
+                ngrams.insert(Ngram::new(slice));
             }
         }
 
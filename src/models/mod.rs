@@ -126,7 +126,7 @@ fn load_json(language: Language, ngram_length: u32) -> std::io::Result<String> {
     let zip_file_reader = Cursor::new(zip_file.contents());
     let mut archive = ZipArchive::new(zip_file_reader).unwrap();
     let mut json_file = archive.by_index(0).unwrap();
-    let mut json = String::new();
+    let mut json = String::with_capacity(json_file.size() as usize);
     json_file.read_to_string(&mut json)?;
     Ok(json)
 }
@@ -215,8 +215,11 @@ fn get_language_models_directory(language: Language) -> Dir<'static> {
 mod tests {
     use super::*;
     use crate::minify;
+    use once_cell::sync::Lazy;
 
-    const EXPECTED_UNIGRAM_MODEL: &str = r#"
+    static EXPECTED_UNIGRAM_MODEL: Lazy<String> = Lazy::new(|| {
+        minify(
+            r#"
     {
         "language":"ENGLISH",
         "ngrams":{
@@ -297,12 +300,14 @@ mod tests {
             "23/93616591":"ý"
         }
     }
-    "#;
+    "#,
+        )
+    });
 
     #[test]
     fn test_load_json() {
         let result = load_json(Language::English, 1);
         assert!(result.is_ok());
-        assert_eq!(result.unwrap(), minify(EXPECTED_UNIGRAM_MODEL));
+        assert_eq!(&result.unwrap(), &*EXPECTED_UNIGRAM_MODEL);
     }
 }
@@ -17,6 +17,7 @@
 use itertools::Itertools;
 use serde::de::{Error, Visitor};
 use serde::{Deserialize, Deserializer, Serialize, Serializer};
+use std::borrow::Borrow;
 use std::fmt;
 use std::fmt::Display;
 
@@ -57,6 +58,12 @@ impl Ngram {
     }
 }
 
+impl Borrow<str> for Ngram {
+    fn borrow(&self) -> &str {
+        &self.value
+    }
+}
+
 impl Display for Ngram {
     fn fmt(&self, f: &mut fmt::Formatter<'_>) -> fmt::Result {
         write!(f, "{}", self.value)
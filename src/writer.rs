@@ -19,11 +19,12 @@ use crate::model::TrainingDataLanguageModel;
 use crate::ngram::Ngram;
 use crate::Language;
 use itertools::Itertools;
+use rayon::prelude::*;
 use regex::Regex;
 use std::collections::HashMap;
-use std::fs::{remove_file, File};
+use std::fs::{metadata, read_to_string, remove_file, File};
 use std::io;
-use std::io::{BufRead, BufReader, LineWriter, Write};
+use std::io::{BufWriter, Write};
 use std::path::Path;
 use zip::write::FileOptions;
 use zip::ZipWriter;
@@ -63,93 +64,74 @@ impl LanguageModelFilesWriter {
         check_input_file_path(input_file_path);
         check_output_directory_path(output_directory_path);
 
+        let input = read_to_string(input_file_path)?.to_lowercase();
+        let lines = input
+            .lines()
+            .filter(|line| !line.trim().is_empty())
+            .collect_vec();
+
         let unigram_model =
-            Self::create_language_model(input_file_path, language, 1, char_class, &hashmap!())?;
+            Self::create_language_model(&lines, language, 1, char_class, &hashmap!());
 
         let bigram_model = Self::create_language_model(
-            input_file_path,
+            &lines,
             language,
             2,
             char_class,
             unigram_model.absolute_frequencies.as_ref().unwrap(),
-        )?;
+        );
 
         let trigram_model = Self::create_language_model(
-            input_file_path,
+            &lines,
             language,
             3,
             char_class,
             bigram_model.absolute_frequencies.as_ref().unwrap(),
-        )?;
+        );
 
         let quadrigram_model = Self::create_language_model(
-            input_file_path,
+            &lines,
             language,
             4,
             char_class,
             trigram_model.absolute_frequencies.as_ref().unwrap(),
-        )?;
+        );
 
         let fivegram_model = Self::create_language_model(
-            input_file_path,
+            &lines,
             language,
             5,
             char_class,
             quadrigram_model.absolute_frequencies.as_ref().unwrap(),
-        )?;
-
-        Self::write_compressed_language_model(
-            &unigram_model,
-            output_directory_path,
-            "unigrams.json",
-        )?;
-        Self::write_compressed_language_model(
-            &bigram_model,
-            output_directory_path,
-            "bigrams.json",
-        )?;
-        Self::write_compressed_language_model(
-            &trigram_model,
-            output_directory_path,
-            "trigrams.json",
-        )?;
-        Self::write_compressed_language_model(
-            &quadrigram_model,
-            output_directory_path,
-            "quadrigrams.json",
-        )?;
-        Self::write_compressed_language_model(
-            &fivegram_model,
-            output_directory_path,
-            "fivegrams.json",
-        )?;
+        );
 
-        Ok(())
+        [
+            (&unigram_model, "unigrams.json"),
+            (&bigram_model, "bigrams.json"),
+            (&trigram_model, "trigrams.json"),
+            (&quadrigram_model, "quadrigrams.json"),
+            (&fivegram_model, "fivegrams.json"),
+        ]
+        .par_iter()
+        .try_for_each(|(model, file_name)| {
+            Self::write_compressed_language_model(model, output_directory_path, file_name)
+        })
     }
 
     fn create_language_model(
-        input_file_path: &Path,
+        lines: &[&str],
         language: &Language,
         ngram_length: usize,
         char_class: &str,
         lower_ngram_absolute_frequencies: &HashMap<Ngram, u32>,
-    ) -> io::Result<TrainingDataLanguageModel> {
-        let file = File::open(input_file_path)?;
-        let reader = BufReader::new(file);
-        let lines = reader
-            .lines()
-            .map(|line| line.unwrap())
-            .filter(|line| !line.trim().is_empty())
-            .collect_vec();
-        let lines_as_str = lines.iter().map(|line| line.as_str()).collect_vec();
-
-        Ok(TrainingDataLanguageModel::from_text(
-            &lines_as_str,
+    ) -> TrainingDataLanguageModel {
+        TrainingDataLanguageModel::from_text(
+            lines,
             language,
             ngram_length,
             char_class,
             lower_ngram_absolute_frequencies,
-        ))
+        )
     }
 
     fn write_compressed_language_model(
@@ -163,7 +145,7 @@ impl LanguageModelFilesWriter {
         let mut zip = ZipWriter::new(zip_file);
 
         zip.start_file(file_name, FileOptions::default())?;
-        zip.write_all(model.to_json().as_bytes())?;
+        model.write_json(&mut zip)?;
 
         Ok(())
     }
@@ -197,14 +179,13 @@ impl TestDataFilesWriter {
         check_input_file_path(input_file_path);
         check_output_directory_path(output_directory_path);
 
-        Self::create_and_write_sentences_file(
-            input_file_path,
-            output_directory_path,
-            maximum_lines,
-        )?;
+        let input = read_to_string(input_file_path)?;
+        let lines = input.lines().collect_vec();
+
+        Self::create_and_write_sentences_file(&lines, output_directory_path, maximum_lines)?;
 
         let single_words = Self::create_and_write_single_words_file(
-            input_file_path,
+            &lines,
             output_directory_path,
             char_class,
             maximum_lines,
@@ -216,7 +197,7 @@ impl TestDataFilesWriter {
     }
 
     fn create_and_write_sentences_file(
-        input_file_path: &Path,
+        lines: &[&str],
         output_directory_path: &Path,
         maximum_lines: u32,
     ) -> io::Result<()> {
@@ -226,16 +207,13 @@ impl TestDataFilesWriter {
             remove_file(&sentences_file_path)?;
         }
 
-        let input_file = File::open(input_file_path)?;
-        let input_lines = BufReader::new(input_file).lines().map(|line| line.unwrap());
-
         let sentences_file = File::create(sentences_file_path)?;
-        let mut sentences_writer = LineWriter::new(sentences_file);
+        let mut sentences_writer = BufWriter::new(sentences_file);
 
         let mut line_counter = 0;
 
-        for line in input_lines {
-            let normalized_whitespace = MULTIPLE_WHITESPACE.replace_all(&line, " ");
+        for line in lines.iter() {
+            let normalized_whitespace = MULTIPLE_WHITESPACE.replace_all(line, " ");
             let removed_quotes = normalized_whitespace.replace("\"", "");
 
             if line_counter < maximum_lines {
@@ -247,44 +225,43 @@ impl TestDataFilesWriter {
             }
         }
 
+        sentences_writer.flush()?;
+
         Ok(())
     }
 
     fn create_and_write_single_words_file(
-        input_file_path: &Path,
+        lines: &[&str],
         output_directory_path: &Path,
         char_class: &str,
         maximum_lines: u32,
     ) -> io::Result<Vec<String>> {
         let single_words_file_path = output_directory_path.join("single-words.txt");
         let word_regex = Regex::new(&format!("[{}]{{5,}}", char_class)).unwrap();
-        let mut words = vec![];
 
         if single_words_file_path.is_file() {
             remove_file(&single_words_file_path)?;
         }
 
-        let input_file = File::open(input_file_path)?;
-        let input_lines = BufReader::new(input_file).lines().map(|line| line.unwrap());
-
         let single_words_file = File::create(single_words_file_path)?;
-        let mut single_words_writer = LineWriter::new(single_words_file);
+        let mut single_words_writer = BufWriter::new(single_words_file);
 
         let mut line_counter = 0;
 
-        for line in input_lines {
-            let removed_punctuation = PUNCTUATION.replace_all(&line, "");
-            let removed_numbers = NUMBERS.replace_all(&removed_punctuation, "");
-            let normalized_whitespace = MULTIPLE_WHITESPACE.replace_all(&removed_numbers, " ");
-            let removed_quotes = normalized_whitespace.replace("\"", "");
-            let mut single_words = removed_quotes
-                .split(' ')
-                .map(|word| word.trim().to_lowercase())
-                .filter(|word| word_regex.is_match(word))
-                .collect_vec();
-
-            words.append(&mut single_words);
-        }
+        let words = lines
+            .par_iter()
+            .flat_map(|line| {
+                let removed_punctuation = PUNCTUATION.replace_all(line, "");
+                let removed_numbers = NUMBERS.replace_all(&removed_punctuation, "");
+                let normalized_whitespace = MULTIPLE_WHITESPACE.replace_all(&removed_numbers, " ");
+                let removed_quotes = normalized_whitespace.replace("\"", "");
+                removed_quotes
+                    .split(' ')
+                    .map(|word| word.trim().to_lowercase())
+                    .filter(|word| word_regex.is_match(word))
+                    .collect_vec()
+            })
+            .collect::<Vec<_>>();
 
         for word in words.iter() {
             if line_counter < maximum_lines {
@@ -296,6 +273,8 @@ impl TestDataFilesWriter {
             }
         }
 
+        single_words_writer.flush()?;
+
         Ok(words)
     }
 
@@ -317,7 +296,7 @@ impl TestDataFilesWriter {
         }
 
         let word_pairs_file = File::create(word_pairs_file_path)?;
-        let mut word_pairs_writer = LineWriter::new(word_pairs_file);
+        let mut word_pairs_writer = BufWriter::new(word_pairs_file);
         let mut line_counter = 0;
 
         for word_pair in word_pairs {
@@ -330,6 +309,8 @@ impl TestDataFilesWriter {
             }
         }
 
+        word_pairs_writer.flush()?;
+
         Ok(())
     }
 }
@@ -341,14 +322,13 @@ fn check_input_file_path(input_file_path: &Path) {
             input_file_path.display()
         );
     }
-    if !input_file_path.exists() {
-        panic!("Input file '{}' does not exist", input_file_path.display());
-    }
-    if !input_file_path.is_file() {
-        panic!(
+    match metadata(input_file_path) {
+        Err(_) => panic!("Input file '{}' does not exist", input_file_path.display()),
+        Ok(metadata) if !metadata.is_file() => panic!(
             "Input file path '{}' does not represent a regular file",
             input_file_path.display()
-        );
+        ),
+        Ok(_) => {}
     }
 }
 
@@ -359,17 +339,16 @@ fn check_output_directory_path(output_directory_path: &Path) {
             output_directory_path.display()
         );
     }
-    if !output_directory_path.exists() {
-        panic!(
+    match metadata(output_directory_path) {
+        Err(_) => panic!(
             "Output directory '{}' does not exist",
             output_directory_path.display()
-        );
-    }
-    if !output_directory_path.is_dir() {
-        panic!(
+        ),
+        Ok(metadata) if !metadata.is_dir() => panic!(
             "Output directory path '{}' does not represent a directory",
             output_directory_path.display()
-        );
+        ),
+        Ok(_) => {}
     }
 }
 
@@ -381,6 +360,8 @@ mod tests {
     use std::path::PathBuf;
     use tempfile::{tempdir, NamedTempFile};
 
+    const CHAR_CLASS: &str = "\\p{L}";
+
     fn create_temp_input_file(content: &str) -> NamedTempFile {
         let mut input_file = NamedTempFile::new().unwrap();
         input_file
@@ -395,13 +376,14 @@ mod tests {
             .map(|it| it.unwrap().path())
             .collect_vec();
 
-        files.sort();
+        files.sort_unstable();
         files
     }
 
     mod language_model_files {
         use super::*;
         use crate::minify;
+        use once_cell::sync::Lazy;
         use zip::ZipArchive;
 
         const TEXT: &str = "
@@ -410,7 +392,9 @@ mod tests {
             By the way, they consist of 23 words in total.
         ";
 
-        const EXPECTED_UNIGRAM_MODEL: &str = r#"
+        static EXPECTED_UNIGRAM_MODEL: Lazy<String> = Lazy::new(|| {
+            minify(
+                r#"
         {
             "language":"ENGLISH",
             "ngrams":{
@@ -425,9 +409,13 @@ mod tests {
                 "13/100":"t"
             }
         }
-        "#;
+        "#,
+            )
+        });
 
-        const EXPECTED_BIGRAM_MODEL: &str = r#"
+        static EXPECTED_BIGRAM_MODEL: Lazy<String> = Lazy::new(|| {
+            minify(
+                r#"
         {
             "language":"ENGLISH",
             "ngrams":{
@@ -448,9 +436,13 @@ mod tests {
                 "4/13":"th"
             }
         }
-        "#;
+        "#,
+            )
+        });
 
-        const EXPECTED_TRIGRAM_MODEL: &str = r#"
+        static EXPECTED_TRIGRAM_MODEL: Lazy<String> = Lazy::new(|| {
+            minify(
+                r#"
         {
             "language":"ENGLISH",
             "ngrams":{
@@ -461,9 +453,13 @@ mod tests {
                 "2/3":"ten"
             }
         }
-        "#;
+        "#,
+            )
+        });
 
-        const EXPECTED_QUADRIGRAM_MODEL: &str = r#"
+        static EXPECTED_QUADRIGRAM_MODEL: Lazy<String> = Lazy::new(|| {
+            minify(
+                r#"
         {
             "language":"ENGLISH",
             "ngrams":{
@@ -472,9 +468,13 @@ mod tests {
                 "1/4":"them thes they"
             }
         }
-        "#;
+        "#,
+            )
+        });
 
-        const EXPECTED_FIVEGRAM_MODEL: &str = r#"
+        static EXPECTED_FIVEGRAM_MODEL: Lazy<String> = Lazy::new(|| {
+            minify(
+                r#"
         {
             "language":"ENGLISH",
             "ngrams":{
@@ -482,7 +482,9 @@ mod tests {
                 "1/2":"ntenc ntend"
             }
         }
-        "#;
+        "#,
+            )
+        });
 
         #[test]
         fn test_language_model_files_writer() {
@@ -492,7 +494,7 @@ mod tests {
                 input_file.path(),
                 output_directory.path(),
                 &Language::English,
-                "\\p{L}",
+                CHAR_CLASS,
             );
 
             assert!(result.is_ok());
@@ -513,18 +515,18 @@ mod tests {
             assert_file_names(quadrigrams_file_path, "quadrigrams.json.zip");
             assert_file_names(fivegrams_file_path, "fivegrams.json.zip");
 
-            assert_file_content(unigrams_file_path, "unigrams.json", EXPECTED_UNIGRAM_MODEL);
-            assert_file_content(bigrams_file_path, "bigrams.json", EXPECTED_BIGRAM_MODEL);
-            assert_file_content(trigrams_file_path, "trigrams.json", EXPECTED_TRIGRAM_MODEL);
+            assert_file_content(unigrams_file_path, "unigrams.json", &EXPECTED_UNIGRAM_MODEL);
+            assert_file_content(bigrams_file_path, "bigrams.json", &EXPECTED_BIGRAM_MODEL);
+            assert_file_content(trigrams_file_path, "trigrams.json", &EXPECTED_TRIGRAM_MODEL);
             assert_file_content(
                 quadrigrams_file_path,
                 "quadrigrams.json",
-                EXPECTED_QUADRIGRAM_MODEL,
+                &EXPECTED_QUADRIGRAM_MODEL,
             );
             assert_file_content(
                 fivegrams_file_path,
                 "fivegrams.json",
-                EXPECTED_FIVEGRAM_MODEL,
+                &EXPECTED_FIVEGRAM_MODEL,
             );
         }
 
@@ -543,16 +545,17 @@ mod tests {
 
             assert_eq!(json_file.name(), expected_file_name);
 
-            let mut json = String::new();
+            let mut json = String::with_capacity(json_file.size() as usize);
             json_file.read_to_string(&mut json).unwrap();
 
-            assert_eq!(json, minify(expected_file_content));
+            assert_eq!(json, expected_file_content);
         }
     }
 
     mod test_data_files {
         use super::*;
         use indoc::indoc;
+        use std::fs::read_to_string;
 
         const TEXT: &str = indoc! {r#"
             There are many attributes associated with good software.
@@ -591,7 +594,7 @@ mod tests {
             let result = TestDataFilesWriter::create_and_write_test_data_files(
                 input_file.path(),
                 output_directory.path(),
-                "\\p{L}",
+                CHAR_CLASS,
                 4,
             );
 
@@ -625,17 +628,68 @@ mod tests {
             expected_file_name: &str,
             expected_file_content: &str,
         ) {
-            assert!(file_path.is_file());
-
             let file_name = file_path.file_name().unwrap();
             assert_eq!(file_name, expected_file_name);
 
-            let mut test_data_file = File::open(file_path).unwrap();
-            let mut test_data_file_content = String::new();
-            test_data_file
-                .read_to_string(&mut test_data_file_content)
-                .unwrap();
+            let test_data_file_content = read_to_string(file_path).unwrap();
             assert_eq!(test_data_file_content, expected_file_content);
         }
     }
+
+    mod path_validation {
+        use super::*;
+        use rstest::*;
+
+        #[rstest(
+            check,
+            path,
+            case::input_file(
+                check_input_file_path as fn(&Path),
+                "relative/path/to/input.txt"
+            ),
+            case::output_directory(
+                check_output_directory_path as fn(&Path),
+                "relative/path/to/directory"
+            )
+        )]
+        #[should_panic(expected = "is not absolute")]
+        fn test_relative_path_panics(check: fn(&Path), path: &str) {
+            check(Path::new(path));
+        }
+
+        #[rstest(
+            check,
+            file_name,
+            case::input_file(
+                check_input_file_path as fn(&Path),
+                "non_existing_input.txt"
+            ),
+            case::output_directory(
+                check_output_directory_path as fn(&Path),
+                "non_existing_directory"
+            )
+        )]
+        #[should_panic(expected = "does not exist")]
+        fn test_non_existing_path_panics(check: fn(&Path), file_name: &str) {
+            let directory = tempdir().expect("Temporary directory could not be created");
+            check(&directory.path().join(file_name));
+        }
+
+        #[rstest(
+            check,
+            path_is_directory,
+            case::input_file(check_input_file_path as fn(&Path), true),
+            case::output_directory(check_output_directory_path as fn(&Path), false)
+        )]
+        #[should_panic(expected = "does not represent a")]
+        fn test_mismatched_file_type_panics(check: fn(&Path), path_is_directory: bool) {
+            if path_is_directory {
+                let directory = tempdir().expect("Temporary directory could not be created");
+                check(directory.path());
+            } else {
+                let file = create_temp_input_file("some content");
+                check(file.path());
+            }
+        }
+    }
 }